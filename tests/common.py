@@ -9,12 +9,11 @@ import sys
 import unittest
 from collections import defaultdict
 
-from distutils.version import LooseVersion
 from parameterized import parameterized
 import numpy as np
 import tensorflow as tf
 
-from tf2onnx import constants, logging, utils, tf_utils, tf_loader
+from tf2onnx import constants, logging, utils, tf_loader
 
 # pylint: disable=import-outside-toplevel
 __all__ = [
@@ -51,7 +50,7 @@ __all__ = [
 class TestConfig(object):
     def __init__(self):
         self.platform = sys.platform
-        self.tf_version = tf_utils.get_tf_version()
+        self.tf_version = utils.make_version_tuple(tf.__version__)
         self.opset = int(os.environ.get("TF2ONNX_TEST_OPSET", constants.PREFERRED_OPSET))
         self.target = os.environ.get("TF2ONNX_TEST_TARGET", ",".join(constants.DEFAULT_TARGET)).split(',')
         self.backend = os.environ.get("TF2ONNX_TEST_BACKEND", "onnxruntime")
@@ -88,7 +87,7 @@ class TestConfig(object):
             pass
 
         if version:
-            version = LooseVersion(version)
+            version = utils.make_version_tuple(version)
         return version
 
     def __str__(self):
@@ -167,7 +166,7 @@ def check_opset_after_tf_version(tf_version, required_opset, message=""):
     """ Skip if tf_version > max_required_version """
     config = get_test_config()
     reason = _append_message("conversion requires opset {} after tf {}".format(required_opset, tf_version), message)
-    skip = config.tf_version >= LooseVersion(tf_version) and config.opset < required_opset
+    skip = config.tf_version >= utils.make_version_tuple(tf_version) and config.opset < required_opset
     return unittest.skipIf(skip, reason)
 
 
@@ -218,14 +217,14 @@ def check_tf_max_version(max_accepted_version, message=""):
     """ Skip if tf_version > max_required_version """
     config = get_test_config()
     reason = _append_message("conversion requires tf <= {}".format(max_accepted_version), message)
-    return unittest.skipIf(config.tf_version > LooseVersion(max_accepted_version), reason)
+    return unittest.skipIf(config.tf_version > utils.make_version_tuple(max_accepted_version), reason)
 
 
 def check_tf_min_version(min_required_version, message=""):
     """ Skip if tf_version < min_required_version """
     config = get_test_config()
     reason = _append_message("conversion requires tf >= {}".format(min_required_version), message)
-    return unittest.skipIf(config.tf_version < LooseVersion(min_required_version), reason)
+    return unittest.skipIf(config.tf_version < utils.make_version_tuple(min_required_version), reason)
 
 
 def skip_tf_versions(excluded_versions, message=""):
@@ -234,7 +233,7 @@ def skip_tf_versions(excluded_versions, message=""):
     condition = False
     reason = _append_message("conversion excludes tf {}".format(excluded_versions), message)
 
-    current_tokens = str(config.tf_version).split('.')
+    current_tokens = [str(v) for v in config.tf_version]
     for excluded_version in excluded_versions:
         exclude_tokens = excluded_version.split('.')
         # assume len(exclude_tokens) <= len(current_tokens)
@@ -302,7 +301,7 @@ def check_onnxruntime_min_version(min_required_version, message=""):
     config = get_test_config()
     reason = _append_message("conversion requires onnxruntime >= {}".format(min_required_version), message)
     return unittest.skipIf(config.is_onnxruntime_backend and
-                           config.backend_version < LooseVersion(min_required_version), reason)
+                           config.backend_version < utils.make_version_tuple(min_required_version), reason)
 
 
 def skip_caffe2_backend(message=""):
@@ -21,7 +21,6 @@ import time
 import zipfile
 import random
 from collections import namedtuple
-from distutils.version import LooseVersion
 
 
 import yaml
@@ -738,7 +737,7 @@ def main():
                 continue
 
             if t.tf_min_version:
-                if tf_utils.get_tf_version() < LooseVersion(str(t.tf_min_version)):
+                if tf_utils.get_tf_version() < utils.make_version_tuple(str(t.tf_min_version)):
                     logger.info("Skip %s: %s %s", test, "Min TF version needed:", t.tf_min_version)
                     continue
 
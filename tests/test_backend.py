@@ -9,7 +9,7 @@ from __future__ import unicode_literals
 
 import os
 import unittest
-from distutils.version import LooseVersion
+from unittest import mock
 from itertools import product
 
 import numpy as np
@@ -17,6 +17,7 @@ from numpy.testing import assert_almost_equal
 import tensorflow as tf
 
 from tensorflow.python.ops import lookup_ops
+import backend_test_base
 from backend_test_base import Tf2OnnxBackendTestBase
 # pylint reports unused-wildcard-import which is false positive, __all__ is defined in common
 from common import *  # pylint: disable=wildcard-import,unused-wildcard-import
@@ -74,7 +75,7 @@ if is_tf2():
     matrix_diag_part = tf.compat.v1.matrix_diag_part
     fake_quant_with_min_max_args = tf.quantization.fake_quant_with_min_max_args
     fake_quant_with_min_max_vars = tf.quantization.fake_quant_with_min_max_vars
-elif LooseVersion(tf.__version__) >= "1.13":
+elif utils.make_version_tuple(tf.__version__) >= (1, 13):
     conv2d_backprop_input = tf.compat.v1.nn.conv2d_backprop_input
     conv3d_transpose = tf.compat.v1.nn.conv3d_transpose
     multinomial = tf.compat.v1.random.multinomial
@@ -88,7 +89,7 @@ elif LooseVersion(tf.__version__) >= "1.13":
     quantize_and_dequantize = tf.compat.v1.quantization.quantize_and_dequantize
     resize_nearest_neighbor = tf.compat.v1.image.resize_nearest_neighbor
     resize_bilinear = tf.compat.v1.image.resize_bilinear
-    if LooseVersion(tf.__version__) >= "1.14":
+    if utils.make_version_tuple(tf.__version__) >= (1, 14):
         resize_bilinear_v2 = tf.compat.v2.image.resize
     is_nan = tf.math.is_nan
     is_inf = tf.math.is_inf
@@ -813,7 +814,7 @@ class BackendTests(Tf2OnnxBackendTestBase):
         self._run_test_case(func, [_OUTPUT], {_INPUT: x_val, _INPUT1: y_val})
 
     @unittest.skipIf(get_test_config().is_mac and get_test_config().is_onnxruntime_backend
-                     and get_test_config().backend_version == "0.2.1", "onnxruntime 0.2.1 has bug on mac")
+                     and get_test_config().backend_version == (0, 2, 1), "onnxruntime 0.2.1 has bug on mac")
     def test_matmul3(self):
         x_shape = [1, 12, 256, 64]
         x_val = np.arange(np.prod(x_shape)).astype("float32").reshape((x_shape))
@@ -4360,6 +4361,67 @@ class BackendTests(Tf2OnnxBackendTestBase):
         self._run_test_case(func, [_OUTPUT], {}, as_session=True)
         os.remove(filnm)
 
+    @check_opset_min_version(8, "CategoryMapper")
+    def test_hashtable_lookup_const_missing_key(self):
+        filnm = "vocab.tmp"
+        words = ["apple", "pear", "banana", "cherry ♥", "grape"]
+        query_val = np.array(['kiwi', 'banana', 'plum'], dtype=np.object)
+        with open(filnm, "w", encoding='UTF-8') as f:
+            for word in words:
+                f.write(word + "\n")
+        def func():
+            hash_table = lookup_ops.index_table_from_file(filnm)
+            query = tf.constant(query_val)
+            lookup_results = hash_table.lookup(query)
+            ret = tf.add(lookup_results, 0, name=_TFOUTPUT)
+            return ret
+        self._run_test_case(func, [_OUTPUT], {}, as_session=True)
+        os.remove(filnm)
+
+    @check_opset_min_version(8, "CategoryMapper")
+    def test_hashtable_lookup_const_scalar(self):
+        filnm = "vocab.tmp"
+        words = ["apple", "pear", "banana", "cherry ♥", "grape"]
+        hit_val = np.array('cherry ♥', dtype=np.object)
+        miss_val = np.array('kiwi', dtype=np.object)
+        with open(filnm, "w", encoding='UTF-8') as f:
+            for word in words:
+                f.write(word + "\n")
+        def func():
+            hash_table = lookup_ops.index_table_from_file(filnm)
+            hit = hash_table.lookup(tf.constant(hit_val))
+            miss = hash_table.lookup(tf.constant(miss_val))
+            ret = tf.add(hit, 0, name=_TFOUTPUT)
+            ret1 = tf.add(miss, 0, name=_TFOUTPUT1)
+            return ret, ret1
+        self._run_test_case(func, [_OUTPUT, _OUTPUT1], {}, as_session=True)
+        os.remove(filnm)
+
+    @check_opset_min_version(8, "CategoryMapper")
+    def test_hashtable_lookup_keeps_initialized_tables(self):
+        filnm = "vocab.tmp"
+        words = ["apple", "pear", "banana", "cherry", "grape"]
+        query_val = np.array(['cherry', 'kiwi'], dtype=np.object)
+        with open(filnm, "w") as f:
+            for word in words:
+                f.write(word + "\n")
+        def func():
+            hash_table = lookup_ops.index_table_from_file(filnm)
+            query = tf.constant(query_val)
+            lookup_results = hash_table.lookup(query)
+            ret = tf.add(lookup_results, 0, name=_TFOUTPUT)
+            return ret
+        with mock.patch.object(backend_test_base, "process_tf_graph",
+                               wraps=backend_test_base.process_tf_graph) as wrapped:
+            self._run_test_case(func, [_OUTPUT], {}, as_session=True)
+        os.remove(filnm)
+        # the lookup handlers cache their own records, the caller's tables must stay (keys, values) tuples
+        tables = [c[1]["initialized_tables"] for c in wrapped.call_args_list if c[1].get("initialized_tables")]
+        self.assertTrue(tables)
+        for table in tables[0].values():
+            self.assertIsInstance(table, tuple)
+            self.assertEqual(len(table), 2)
+
     def test_hashtable_size(self):
         filnm = "vocab.tmp"
         words = ["apple", "pear", "banana", "cherry", "grape"]
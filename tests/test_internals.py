@@ -198,6 +198,13 @@ class Tf2OnnxInternalTests(Tf2OnnxBackendTestBase):
         self.assertEqual(expected_inputs, inputs)
         self.assertEqual(expected_shape, shape_override)
 
+    def test_make_version_tuple(self):
+        self.assertEqual(utils.make_version_tuple("2.4.1"), (2, 4, 1))
+        self.assertEqual(utils.make_version_tuple("1.15"), (1, 15))
+        self.assertEqual(utils.make_version_tuple("2.5.0rc0"), (2, 5, 0))
+        self.assertEqual(utils.make_version_tuple("2.6.0-rc1"), (2, 6, 0))
+        self.assertTrue(utils.make_version_tuple("2.10.0") > (2, 2))
+
     def test_shape_utils(self):
         self.assertEqual(utils.merge_shapes(None, None), None)
         self.assertEqual(utils.merge_shapes([], None), [])
@@ -16,6 +16,7 @@ from backend_test_base import Tf2OnnxBackendTestBase
 from common import unittest_main, group_nodes_by_type, check_opset_min_version, check_opset_max_version, get_test_config
 from tf2onnx import utils, constants
 from tf2onnx.graph import GraphUtil
+from tf2onnx.optimizer import OrtConstFoldOptimizer
 
 
 # pylint: disable=missing-docstring,invalid-name,unused-argument,using-constant-test
@@ -1703,6 +1704,159 @@ class OptimizerTests(Tf2OnnxBackendTestBase):
         self.run_and_compare(["res"], {"X": np.random.randn(*shape).astype(np.int64)}, model_proto,
                              "Cast", 0)
 
+    @check_opset_max_version(12, "Squeeze/Unsqueeze changed in opset 13")
+    def test_const_fold_squeeze_with_const(self):
+        shape = (1, 6, 1, 6)
+        const_tensor = helper.make_tensor(name='const_tensor', data_type=TensorProto.FLOAT, dims=shape,
+                                          vals=np.random.randn(*shape).flatten().astype(np.float32))
+        node1 = helper.make_node("Constant", [], ["const"], value=const_tensor)
+        node2 = helper.make_node("Squeeze", ["const"], ["value1"], axes=[0, 2])
+        node3 = helper.make_node("Add", ["value1", "X"], ["res"])
+
+        graph = helper.make_graph(
+            [node1, node2, node3],
+            "test_const_fold_squeeze_with_const",
+            [helper.make_tensor_value_info("X", TensorProto.FLOAT, (1,))],
+            [helper.make_tensor_value_info("res", TensorProto.FLOAT, (6, 6))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        self.run_and_compare(["res"], {"X": np.random.randn(1).astype(np.float32)}, model_proto,
+                             "Squeeze", 0)
+
+    @check_opset_min_version(13, "Squeeze/Unsqueeze changed in opset 13")
+    def test_const_fold_squeeze_with_const_13(self):
+        shape = (1, 6, 1, 6)
+        const_tensor = helper.make_tensor(name='const_tensor', data_type=TensorProto.FLOAT, dims=shape,
+                                          vals=np.random.randn(*shape).flatten().astype(np.float32))
+        node1 = helper.make_node("Constant", [], ["const"], value=const_tensor)
+        axes = self._make_onnx_const(np.array([0, 2], dtype=np.int64), "axes")
+        node2 = helper.make_node("Squeeze", ["const", "axes"], ["value1"])
+        node3 = helper.make_node("Add", ["value1", "X"], ["res"])
+
+        graph = helper.make_graph(
+            [node1, node2, node3, axes],
+            "test_const_fold_squeeze_with_const",
+            [helper.make_tensor_value_info("X", TensorProto.FLOAT, (1,))],
+            [helper.make_tensor_value_info("res", TensorProto.FLOAT, (6, 6))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        self.run_and_compare(["res"], {"X": np.random.randn(1).astype(np.float32)}, model_proto,
+                             "Squeeze", 0)
+
+    def test_const_fold_concat_with_const(self):
+        const1 = self._make_onnx_const(np.random.randn(2, 3).astype(np.float32), "const1")
+        const2 = self._make_onnx_const(np.random.randn(4, 3).astype(np.float32), "const2")
+        node1 = helper.make_node("Concat", ["const1", "const2"], ["value1"], axis=0)
+        node2 = helper.make_node("Add", ["value1", "X"], ["res"])
+
+        graph = helper.make_graph(
+            [const1, const2, node1, node2],
+            "test_const_fold_concat_with_const",
+            [helper.make_tensor_value_info("X", TensorProto.FLOAT, (1,))],
+            [helper.make_tensor_value_info("res", TensorProto.FLOAT, (6, 3))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        self.run_and_compare(["res"], {"X": np.random.randn(1).astype(np.float32)}, model_proto,
+                             "Concat", 0)
+
+    @check_opset_min_version(11, "Range")
+    def test_ort_const_fold_range(self):
+        start = self._make_onnx_const(np.array(0, dtype=np.float32), "start")
+        limit = self._make_onnx_const(np.array(6, dtype=np.float32), "limit")
+        delta = self._make_onnx_const(np.array(1, dtype=np.float32), "delta")
+        node1 = helper.make_node("Range", ["start", "limit", "delta"], ["value1"])
+        node2 = helper.make_node("Mul", ["value1", "value1"], ["value2"])
+        node3 = helper.make_node("Add", ["value2", "X"], ["res"])
+
+        graph = helper.make_graph(
+            [start, limit, delta, node1, node2, node3],
+            "test_ort_const_fold_range",
+            [helper.make_tensor_value_info("X", TensorProto.FLOAT, (6,))],
+            [helper.make_tensor_value_info("res", TensorProto.FLOAT, (6,))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        feed_dict = {"X": np.random.randn(6).astype(np.float32)}
+        origin_model_path = self.save_onnx_model(model_proto, feed_dict, postfix="_origin")
+
+        g = GraphUtil.create_graph_from_onnx_model(model_proto)
+        g = OrtConstFoldOptimizer().optimize(g)
+        new_proto = g.make_model("test_ort_const_fold_range")
+        new_model_path = self.save_onnx_model(new_proto, feed_dict, postfix="_opt")
+
+        current = GraphUtil.get_node_count_from_onnx_graph(new_proto.graph)
+        self.assertEqual(current["Range"], 0)
+        self.assertEqual(current["Mul"], 0)
+        expected = self.run_onnxruntime(origin_model_path, feed_dict, ["res"])
+        actual = self.run_onnxruntime(new_model_path, feed_dict, ["res"])
+        self.assertAllClose(expected[0], actual[0], rtol=1e-07, atol=1e-5)
+
+    @check_opset_min_version(10, "DequantizeLinear")
+    def test_ort_const_fold_skips_dequantize(self):
+        inputval = self._make_onnx_const(np.random.randint(0, 100, (2, 3), np.uint8), "X")
+        scale = self._make_onnx_const(np.array(0.75, dtype=np.float32), "scale")
+        zero_point = self._make_onnx_const(np.array(3, dtype=np.uint8), "zero_point")
+        node1 = helper.make_node("DequantizeLinear", ["X", "scale", "zero_point"], ["Y"], name="dequantize")
+        node2 = helper.make_node("Add", ["Y", "A"], ["res"])
+
+        graph = helper.make_graph(
+            [inputval, scale, zero_point, node1, node2],
+            "test_ort_const_fold_skips_dequantize",
+            [helper.make_tensor_value_info("A", TensorProto.FLOAT, (2, 3))],
+            [helper.make_tensor_value_info("res", TensorProto.FLOAT, (2, 3))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        g = GraphUtil.create_graph_from_onnx_model(model_proto)
+        g = OrtConstFoldOptimizer().optimize(g)
+        new_proto = g.make_model("test_ort_const_fold_skips_dequantize")
+
+        current = GraphUtil.get_node_count_from_onnx_graph(new_proto.graph)
+        self.assertEqual(current["DequantizeLinear"], 1)
+
+    def test_ort_const_fold_failing_node(self):
+        const_a = self._make_onnx_const(np.array([1, 2, 3], dtype=np.float32), "A")
+        const_b = self._make_onnx_const(np.array([4, 5, 6], dtype=np.float32), "B")
+        node1 = helper.make_node("Add", ["A", "B"], ["sum"])
+        node2 = helper.make_node("Cast", ["A"], ["casted"], to=TensorProto.INT64)
+        node3 = helper.make_node("Mul", ["casted", "casted"], ["squared"])
+        node4 = helper.make_node("Add", ["sum", "X"], ["res1"])
+        node5 = helper.make_node("Add", ["squared", "Y"], ["res2"])
+
+        graph = helper.make_graph(
+            [const_a, const_b, node1, node2, node3, node4, node5],
+            "test_ort_const_fold_failing_node",
+            [helper.make_tensor_value_info("X", TensorProto.FLOAT, (3,)),
+             helper.make_tensor_value_info("Y", TensorProto.INT64, (3,))],
+            [helper.make_tensor_value_info("res1", TensorProto.FLOAT, (3,)),
+             helper.make_tensor_value_info("res2", TensorProto.INT64, (3,))],
+        )
+
+        model_proto = self.make_model(graph, producer_name="onnx-tests")
+        feed_dict = {"X": np.random.randn(3).astype(np.float32),
+                     "Y": np.random.randint(0, 10, (3,)).astype(np.int64)}
+        origin_model_path = self.save_onnx_model(model_proto, feed_dict, postfix="_origin")
+
+        g = GraphUtil.create_graph_from_onnx_model(model_proto)
+        # a dtype that doesn't match the Cast makes any onnxruntime session containing it fail
+        g.set_dtype("casted", TensorProto.FLOAT)
+        g = OrtConstFoldOptimizer().optimize(g)
+        g.set_dtype("casted", TensorProto.INT64)
+        new_proto = g.make_model("test_ort_const_fold_failing_node")
+        new_model_path = self.save_onnx_model(new_proto, feed_dict, postfix="_opt")
+
+        current = GraphUtil.get_node_count_from_onnx_graph(new_proto.graph)
+        self.assertEqual(current["Add"], 2)
+        self.assertEqual(current["Cast"], 1)
+        self.assertEqual(current["Mul"], 1)
+        expected = self.run_onnxruntime(origin_model_path, feed_dict, ["res1", "res2"])
+        actual = self.run_onnxruntime(new_model_path, feed_dict, ["res1", "res2"])
+        self.assertAllClose(expected[0], actual[0], rtol=1e-07, atol=1e-5)
+        self.assertAllClose(expected[1], actual[1])
+
     # Const Fold Optimizer Tests End
 
     # Const Dequantize Optimizer Tests Start
@@ -41,6 +41,10 @@ If you run into issues, open an issue here:
     https://github.com/onnx/tensorflow-onnx/issues
 """
 
+# arguments given as comma-separated lists on the command line
+_COMMA_SEPARATED_ARGS = ["outputs", "ignore_default", "use_default", "rename_outputs", "rename_inputs",
+                         "inputs_as_nchw", "target"]
+
 
 def get_args():
     """Parse commandline."""
@@ -80,6 +84,8 @@ def get_args():
     parser.add_argument("--output_frozen_graph", help="output frozen tf graph to file")
     parser.add_argument("--fold_const", help="Deprecated. Constant folding is always enabled.",
                         action="store_true")
+    parser.add_argument("--fold_const_with_ort", help="Fold constant subgraphs by running them with onnxruntime "
+                                                      "(requires onnxruntime)", action="store_true")
     # experimental
     parser.add_argument("--inputs-as-nchw", help="transpose inputs as from nhwc to nchw")
     args = parser.parse_args()
@@ -96,20 +102,10 @@ def get_args():
         sys.exit(1)
     if args.inputs:
         args.inputs, args.shape_override = utils.split_nodename_and_shape(args.inputs)
-    if args.outputs:
-        args.outputs = args.outputs.split(",")
-    if args.ignore_default:
-        args.ignore_default = args.ignore_default.split(",")
-    if args.use_default:
-        args.use_default = args.use_default.split(",")
-    if args.rename_outputs:
-        args.rename_outputs = args.rename_outputs.split(",")
-    if args.rename_inputs:
-        args.rename_inputs = args.rename_inputs.split(",")
-    if args.inputs_as_nchw:
-        args.inputs_as_nchw = args.inputs_as_nchw.split(",")
-    if args.target:
-        args.target = args.target.split(",")
+    for arg_name in _COMMA_SEPARATED_ARGS:
+        value = getattr(args, arg_name)
+        if value:
+            setattr(args, arg_name, value.split(","))
     if args.signature_def:
         args.signature_def = [args.signature_def]
     if args.dequantize:
@@ -223,6 +219,8 @@ def main():
                              tflite_path=tflite_path,
                              dequantize=args.dequantize)
 
+    if args.fold_const_with_ort:
+        g = optimizer.OrtConstFoldOptimizer().optimize(g)
     onnx_graph = optimizer.optimize_graph(g)
 
     tensor_storage = ExternalTensorStorage() if args.large_model else None
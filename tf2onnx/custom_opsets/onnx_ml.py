@@ -2,6 +2,7 @@
 
 """ tf2onnx mapping functions for onnx ml domain. """
 import logging
+import types
 import numpy as np
 from onnx import TensorProto
 from onnx import numpy_helper
@@ -14,6 +15,52 @@ logger = logging.getLogger(__name__)
 
 # pylint: disable=unused-argument,missing-docstring,unnecessary-pass
 
+
+def _get_table_node(node, initialized_tables):
+    """Returns the HashTable node feeding a lookup node, skipping Identity ops, and its shared name."""
+    table_node = node.inputs[0]
+    while table_node.type == 'Identity':
+        table_node = table_node.inputs[0]
+    shared_name = table_node.get_attr_value("shared_name")
+    utils.make_sure(shared_name is not None, "Could not determine table shared name for node %s", node.name)
+    utils.make_sure(shared_name in initialized_tables, "Initialized table %s for node %s not found.",
+                    shared_name, node.name)
+    return table_node, shared_name
+
+
+def _get_table(initialized_tables, shared_name):
+    """
+    Returns the table record for shared_name. Tables are given as (keys, values) tuples and are
+    normalized once into a record holding the keys, values, size and a lazily built lookup.
+    The record replaces the tuple in initialized_tables, which is the private copy made by
+    tensorflow_onnx_mapping, not the mapping passed to process_tf_graph.
+    """
+    table = initialized_tables[shared_name]
+    if isinstance(table, tuple):
+        keys, values = table
+        table = types.SimpleNamespace(strings=np.asarray(keys, dtype=object),
+                                      ints=np.asarray(values, dtype=np.int64), size=len(keys), lut=None)
+        initialized_tables[shared_name] = table
+    return table
+
+
+def _get_lut(table):
+    """Returns the (sorted keys, sorted values) pair of a table, sorting it on first use."""
+    if table.lut is None:
+        order = np.argsort(table.strings)
+        table.lut = (table.strings[order], table.ints[order])
+    return table.lut
+
+
+def _lookup_sorted(keys_sorted, vals_sorted, keys, default_val):
+    """Vectorized lookup of an array of keys in a sorted table."""
+    if len(keys_sorted) == 0:
+        return np.full(keys.shape, default_val, dtype=np.int64)
+    idx = np.clip(np.searchsorted(keys_sorted, keys), 0, len(keys_sorted) - 1)
+    hit = keys_sorted[idx] == keys
+    return np.where(hit, vals_sorted[idx], default_val).astype(np.int64)
+
+
 @tf_op("HashTableV2")
 class HashTable:
     @classmethod
@@ -27,13 +74,7 @@ class LookupTableFind:
     @classmethod
     def version_8(cls, ctx, node, initialized_tables, **kwargs):
         """ convert lookup to category mapper """
-        table_node = node.inputs[0]
-        while table_node.type == 'Identity':
-            table_node = table_node.inputs[0]
-        shared_name = table_node.get_attr_value("shared_name")
-        utils.make_sure(shared_name is not None, "Could not determine table shared name for node %s", node.name)
-        utils.make_sure(shared_name in initialized_tables, "Initialized table %s for node %s not found.",
-                        shared_name, node.name)
+        table_node, shared_name = _get_table_node(node, initialized_tables)
 
         default_node = node.inputs[2]
         utils.make_sure(default_node.is_const(), "Default value of table lookup must be const.")
@@ -45,7 +86,7 @@ class LookupTableFind:
         utils.make_sure(dtype == TensorProto.INT64 and in_dtype == TensorProto.STRING,
                         "Only lookup tables of type string->int64 are currently supported.")
 
-        cats_strings, cats_int64s = initialized_tables[shared_name]
+        table = _get_table(initialized_tables, shared_name)
         shape = ctx.get_shape(node.output[0])
 
         node_name = node.name
@@ -56,18 +97,22 @@ class LookupTableFind:
             # Handle explicitly since const folding doesn't work for tables
             key_np = node.inputs[1].get_tensor_value(as_list=False)
             ctx.remove_node(node.name)
-            key_to_val = dict(zip(cats_strings, cats_int64s))
-            def lookup_value(key):
-                return key_to_val.get(key.encode("UTF-8"), default_val_np)
-            lookup_result = np.vectorize(lookup_value)(key_np)
-            onnx_tensor = numpy_helper.from_array(lookup_result, node_name)
+            key_bytes = np.array([k.encode("UTF-8") for k in key_np.flat], dtype=object).reshape(key_np.shape)
+            keys_sorted, vals_sorted = _get_lut(table)
+            lookup_result = _lookup_sorted(keys_sorted, vals_sorted, key_bytes, default_val_np)
+            if lookup_result.ndim == 0:
+                # scalar keys are the common case, skip the numpy round trip of numpy_helper.from_array
+                onnx_tensor = TensorProto(name=node_name, data_type=TensorProto.INT64,
+                                          int64_data=[int(lookup_result)])
+            else:
+                onnx_tensor = numpy_helper.from_array(lookup_result, node_name)
             ctx.make_node("Const", name=node_name, inputs=[], outputs=node_outputs,
                           attr={"value": onnx_tensor}, shapes=[lookup_result.shape], dtypes=[dtype])
         else:
             ctx.remove_node(node.name)
             ctx.make_node("CategoryMapper", domain=constants.AI_ONNX_ML_DOMAIN,
                           name=node_name, inputs=[node_inputs[1]], outputs=node_outputs,
-                          attr={'cats_int64s': cats_int64s, 'cats_strings': cats_strings, 'default_int64': default_val},
+                          attr={'cats_int64s': table.ints, 'cats_strings': table.strings, 'default_int64': default_val},
                           shapes=[shape], dtypes=[dtype])
 
         customer_nodes = ctx.find_output_consumers(table_node.output[0])
@@ -79,19 +124,13 @@ class LookupTableFind:
 class LookupTableSize:
     @classmethod
     def version_1(cls, ctx, node, initialized_tables, **kwargs):
-        table_node = node.inputs[0]
-        while table_node.type == 'Identity':
-            table_node = table_node.inputs[0]
-        shared_name = table_node.get_attr_value("shared_name")
-        utils.make_sure(shared_name is not None, "Could not determine table shared name for node %s", node.name)
-        utils.make_sure(shared_name in initialized_tables, "Initialized table %s for node %s not found.",
-                        shared_name, node.name)
-        keys, _ = initialized_tables[shared_name]
+        table_node, shared_name = _get_table_node(node, initialized_tables)
+        table = _get_table(initialized_tables, shared_name)
 
         node_name = node.name
         node_outputs = node.output
         ctx.remove_node(node.name)
-        size_const = ctx.make_const(node_name, np.array(len(keys), dtype=np.int64))
+        size_const = ctx.make_const(node_name, np.array(table.size, dtype=np.int64))
         ctx.replace_all_inputs(node_outputs[0], size_const.output[0])
 
         customer_nodes = ctx.find_output_consumers(table_node.output[0])
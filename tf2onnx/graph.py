@@ -1139,7 +1139,20 @@ class Graph(object):
             doc: text for doc string of the model
         """
         graph = self.make_graph(graph_doc, graph_name, external_tensor_storage)
+        model_proto = self.make_model_from_graph_proto(graph, **kwargs)
 
+        # optimize the model proto.
+        # TODO: this is disabled by default because of bugs in fuse_consecutive_transposes
+        if optimize:
+            model_proto = optimizer.optimize(model_proto)
+        return model_proto
+
+    def make_model_from_graph_proto(self, graph, **kwargs):
+        """
+        Wrap a GraphProto into a ModelProto with the opsets and IR version of this graph.
+        Args:
+            graph: onnx GraphProto, e.g. from make_graph
+        """
         if "producer_name" not in kwargs:
             kwargs = {"producer_name": "tf2onnx",
                       "producer_version": __version__}
@@ -1162,11 +1175,6 @@ class Graph(object):
             model_proto.ir_version = constants.OPSET_TO_IR_VERSION.get(self.opset, model_proto.ir_version)
         except: # pylint: disable=bare-except
             logger.error("ir_version override failed - install the latest onnx version")
-
-        # optimize the model proto.
-        # TODO: this is disabled by default because of bugs in fuse_consecutive_transposes
-        if optimize:
-            model_proto = optimizer.optimize(model_proto)
         return model_proto
 
     def make_onnx_graph_io(self, ids):
@@ -17,6 +17,7 @@ from .loop_optimizer import LoopOptimizer
 from .back_to_back_optimizer import BackToBackOptimizer
 from .upsample_optimizer import UpsampleOptimizer
 from .const_dequantize_optimizer import ConstDequantizeOptimizer
+from .ort_const_fold_optimizer import OrtConstFoldOptimizer
 from .. import logging
 
 # optimizer sequence need to be considered carefully
@@ -6,6 +6,8 @@
    for example, input of transpose node is const then we can do transpose statically instead of at runtime
 """
 
+import numpy as np
+
 from .. import utils
 from .optimizer_base import GraphOptimizerBase
 
@@ -153,3 +155,25 @@ class ConstFoldOptimizer(GraphOptimizerBase):
 
         const_val_after_unsqueeze = const_val.reshape(shape_out)
         return [const_val_after_unsqueeze]
+
+    @staticmethod
+    @_register_func("Squeeze")
+    def _fold_squeeze(node, graph):
+        const_val = node.inputs[0].get_tensor_value(as_list=False)
+        if graph.opset >= 13:
+            axes = node.inputs[1].get_tensor_value(as_list=True) if len(node.input) > 1 else None
+        else:
+            axes_attr = node.get_attr("axes")
+            axes = list(axes_attr.ints) if axes_attr else None
+        if axes is not None:
+            axes = tuple(axes)
+        const_val_after_squeeze = np.squeeze(const_val, axis=axes)
+        return [const_val_after_squeeze]
+
+    @staticmethod
+    @_register_func("Concat")
+    def _fold_concat(node, graph):
+        const_vals = [inp.get_tensor_value(as_list=False) for inp in node.inputs]
+        axis = node.get_attr_value("axis")
+        const_val_after_concat = np.concatenate(const_vals, axis=axis)
+        return [const_val_after_concat]
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0
+
+
+"""onnxruntime const fold Optimizer.
+   nodes whose inputs are all const, directly or through other such nodes, are evaluated together
+   in onnxruntime and replaced with their values. Unlike ConstFoldOptimizer this needs no python
+   implementation of the op, but it requires onnxruntime to be installed.
+"""
+
+from onnx import helper, numpy_helper, TensorProto
+
+from .. import utils
+from .const_fold_optimizer import ConstFoldOptimizer
+
+# pylint: disable=logging-not-lazy,unused-argument,missing-docstring,import-outside-toplevel
+
+# ops whose outputs are not a deterministic function of their inputs
+_NONDETERMINISTIC_OPS = ["RandomNormal", "RandomNormalLike", "RandomUniform", "RandomUniformLike",
+                         "Multinomial", "Bernoulli"]
+
+
+class OrtConstFoldOptimizer(ConstFoldOptimizer):
+
+    def _optimize_at_current_graph_level(self, graph):
+        nodes = self._find_foldable_nodes(graph)
+        if not nodes:
+            return graph
+        values = {}
+        self._compute_values_in_batches(graph, nodes, values)
+
+        for node in nodes:
+            if not all(out in values for out in node.output):
+                continue
+            vals = [values[out] for out in node.output]
+            # inputs computed here were already replaced by consts when their producer was folded
+            inp_shapes = [inp.get_tensor_value(as_list=False).shape
+                          for inp in node.inputs if inp and inp.is_const()]
+            if any(utils.is_huge_shape(v.shape) for v in vals) and all(utils.is_small_shape(s) for s in inp_shapes):
+                self.logger.debug("Skipping folding of node %s since its result is much larger than its inputs",
+                                  node.name)
+                continue
+            self._replace_node_with_const(node, graph, vals)
+            self.graph_been_opt = True
+        return graph
+
+    @staticmethod
+    def _should_skip(node):
+        if ConstFoldOptimizer._should_skip(node):
+            return True
+        if node.type in _NONDETERMINISTIC_OPS or node.get_body_graphs():
+            return True
+        return False
+
+    def _find_foldable_nodes(self, graph):
+        """Return the nodes whose inputs are all const or outputs of other such nodes, in topological order."""
+        graph_outputs = set(graph.outputs)
+        known_outputs = set(n.output[0] for n in graph.get_nodes() if n.is_const())
+        foldable = []
+        foldable_names = set()
+        changed = True
+        while changed:
+            changed = False
+            for node in graph.get_nodes():
+                if node.name in foldable_names or self._should_skip(node):
+                    continue
+                if not all(inp in known_outputs for inp in node.input if inp):
+                    continue
+                if graph_outputs.intersection(node.output):
+                    continue
+                if any(graph.get_dtype(out) is None for out in node.output):
+                    continue
+                foldable.append(node)
+                foldable_names.add(node.name)
+                known_outputs.update(node.output)
+                changed = True
+        return foldable
+
+    def _compute_values_in_batches(self, graph, nodes, values):
+        """Add the outputs of nodes to values. If onnxruntime fails on a batch it is split in half and retried,
+           so a single node that can't be evaluated doesn't prevent folding the others."""
+        nodes = self._drop_unavailable_nodes(graph, nodes, values)
+        if not nodes:
+            return
+        try:
+            values.update(self._compute_values(graph, nodes, values))
+        except Exception:  # pylint: disable=broad-except
+            if len(nodes) == 1:
+                self.logger.debug("Failed to fold node %s with onnxruntime", nodes[0].name, exc_info=1)
+                return
+            mid = len(nodes) // 2
+            self._compute_values_in_batches(graph, nodes[:mid], values)
+            self._compute_values_in_batches(graph, nodes[mid:], values)
+
+    @staticmethod
+    def _drop_unavailable_nodes(graph, nodes, values):
+        """Remove nodes depending on the output of a node that failed in an earlier batch."""
+        available = set(values)
+        kept = []
+        for node in nodes:
+            if all(not inp or inp in available or graph.get_node_by_output(inp).is_const() for inp in node.input):
+                kept.append(node)
+                available.update(node.output)
+        return kept
+
+    @staticmethod
+    def _compute_values(graph, nodes, values):
+        """Run the given nodes in one onnxruntime session and return a map from output name to value.
+           Inputs computed by earlier batches are taken from values."""
+        import onnxruntime as ort
+
+        graph.update_proto()
+        folded_outputs = set()
+        for node in nodes:
+            folded_outputs.update(node.output)
+
+        initializers = {}
+        for node in nodes:
+            for inp, inp_node in zip(node.input, node.inputs):
+                if not inp or inp in folded_outputs or inp in initializers:
+                    continue
+                if inp in values:
+                    tensor = numpy_helper.from_array(values[inp], inp)
+                else:
+                    tensor = TensorProto()
+                    tensor.CopyFrom(inp_node.get_attr("value").t)
+                    tensor.name = inp
+                initializers[inp] = tensor
+
+        output_names = [out for node in nodes for out in node.output]
+        outputs = [utils.make_onnx_inputs_outputs(out, graph.get_dtype(out), None) for out in output_names]
+        onnx_graph = helper.make_graph([node.op for node in nodes], "ort_const_fold", [], outputs,
+                                       initializer=list(initializers.values()))
+        model_proto = graph.make_model_from_graph_proto(onnx_graph)
+
+        sess = ort.InferenceSession(model_proto.SerializeToString(), providers=["CPUExecutionProvider"])
+        results = sess.run(output_names, {})
+        return dict(zip(output_names, results))
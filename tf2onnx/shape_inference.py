@@ -9,7 +9,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 import logging
-from distutils.version import LooseVersion
 from collections import defaultdict
 import numpy as np
 from tf2onnx import utils
@@ -35,7 +34,7 @@ def infer_shape(tf_graph, shape_override):
 
     op_outputs_with_none_shape = check_shape_for_tf_graph(tf_graph)
     if op_outputs_with_none_shape:
-        if get_tf_version() > LooseVersion("1.5.0"):
+        if get_tf_version() > (1, 5, 0):
             for op, outs in op_outputs_with_none_shape.items():
                 logger.warning(
                     "Cannot infer shape for %s: %s",
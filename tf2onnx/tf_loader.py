@@ -9,7 +9,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging
-from distutils.version import LooseVersion
 
 import tensorflow as tf
 import numpy as np
@@ -75,7 +74,7 @@ if is_tf2():
     tf_placeholder = tf.compat.v1.placeholder
     tf_placeholder_with_default = tf.compat.v1.placeholder_with_default
     extract_sub_graph = tf.compat.v1.graph_util.extract_sub_graph
-elif LooseVersion(tf.__version__) >= "1.13":
+elif get_tf_version() >= (1, 13):
     # 1.13 introduced the compat namespace
     tf_reset_default_graph = tf.compat.v1.reset_default_graph
     tf_global_variables = tf.compat.v1.global_variables
@@ -100,6 +99,7 @@ else:
 
 
 def inputs_without_resource(sess, input_names):
+    """Remove resource inputs. sess can be anything with a graph attribute, e.g. a session or a function."""
     try:
         new_input_names = []
         for n in input_names:
@@ -137,16 +137,16 @@ def from_function(func, input_names, output_names, large_model=False):
     if large_model:
         return convert_variables_to_constants_large_model(func)
 
-    if get_tf_version() < LooseVersion("2.2"):
+    if get_tf_version() < (2, 2):
         frozen_func = convert_variables_to_constants_v2(func, lower_control_flow=False)
     else:
         frozen_func = convert_variables_to_constants_v2(func, lower_control_flow=False, aggressive_inlining=True)
     graph_def = frozen_func.graph.as_graph_def(add_shapes=True)
     # output_names = [i.name for i in frozen_func.outputs]
+    # the frozen function's graph already has the tensors, no need to import graph_def to look up input dtypes
+    input_names = inputs_without_resource(frozen_func, input_names)
     tf_reset_default_graph()
-    with tf_session() as sess:
-        tf.import_graph_def(graph_def, name='')
-        input_names = inputs_without_resource(sess, input_names)
+    with tf_session():
         graph_def = tf_optimize(input_names, output_names, graph_def)
     return graph_def
 
@@ -552,7 +552,7 @@ def tf_optimize(input_names, output_names, graph_def, fold_constant=True):
                    [utils.node_name(i) for i in output_names]
     graph_def = extract_sub_graph(graph_def, needed_names)
 
-    want_grappler = is_tf2() or LooseVersion(tf.__version__) >= "1.15"
+    want_grappler = is_tf2() or get_tf_version() >= (1, 15)
     if want_grappler:
         graph_def = tf_optimize_grappler(input_names, output_names, graph_def, fold_constant)
     else:
@@ -572,7 +572,7 @@ def tf_optimize(input_names, output_names, graph_def, fold_constant=True):
 def tf_reload_graph(tf_graph):
     """Invoke tensorflow cpp shape inference by reloading graph_def."""
     # invoke c api if tf version is below 1.8
-    if get_tf_version() < LooseVersion("1.8"):
+    if get_tf_version() < (1, 8):
         logger.debug(
             "On TF < 1.8, graph is constructed by python API, "
             "which doesn't invoke shape inference, please set "
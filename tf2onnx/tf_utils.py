@@ -10,7 +10,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import collections
-from distutils.version import LooseVersion
 
 import numpy as np
 import tensorflow as tf
@@ -20,7 +19,8 @@ from tensorflow.python.framework import tensor_util
 
 from onnx import helper, onnx_pb, numpy_helper
 
-from tf2onnx.utils import make_sure, is_tf_const_op, port_name, map_onnx_to_numpy_type
+from tf2onnx.utils import make_sure, is_tf_const_op, port_name, map_onnx_to_numpy_type, make_version_tuple, \
+    is_small_shape, is_huge_shape
 from . import logging
 
 logger = logging.getLogger(__name__)
@@ -122,8 +122,15 @@ def get_tf_node_attr(node, name):
     return node.get_attr(name)
 
 
+_TF_VERSION = make_version_tuple(tf.__version__)
+
+
 def get_tf_version():
-    return LooseVersion(tf.__version__)
+    """
+    Return the tensorflow version as a tuple of ints, e.g. (2, 4, 1).
+    This used to be a LooseVersion, compare against tuples like (2, 4) rather than strings.
+    """
+    return _TF_VERSION
 
 def compress_graph_def(graph_def):
     """
@@ -179,21 +186,18 @@ def compute_const_folding_using_tf(g, const_node_values, graph_outputs):
     outputs_to_dtypes = {}
     outputs_to_shapes = {}
     shape_node_outputs = {}
-
-    def is_small_shape(x):
-        return np.product(x) <= 1000
-
-    def is_huge_shape(x):
-        return np.product(x) >= 1000000
+    # large constants removed by compress_graph_def are only decoded if a foldable node consumes them
+    compressed_const_ops = {}
 
     for node in ops:
-        # Load values of constants. Use const_node_values if possible
+        # Load values of constants. Those in const_node_values are loaded on demand.
         if node.type in ["Const", "ConstV2"]:
-            tensor = node.node_def.attr["value"].tensor
             if node.name in const_node_values:
-                tensor.tensor_content = const_node_values[node.name]
-            outputs_to_values[node.outputs[0].name] = get_tf_tensor_data(tensor)
-            outputs_to_dtypes[node.outputs[0].name] = node.outputs[0].dtype
+                compressed_const_ops[node.outputs[0].name] = node
+            else:
+                tensor = node.node_def.attr["value"].tensor
+                outputs_to_values[node.outputs[0].name] = get_tf_tensor_data(tensor)
+                outputs_to_dtypes[node.outputs[0].name] = node.outputs[0].dtype
         for out in node.outputs:
             outputs_to_shapes[out.name] = get_tf_tensor_shape(out)
 
@@ -203,6 +207,16 @@ def compute_const_folding_using_tf(g, const_node_values, graph_outputs):
             if shape is not None:
                 shape_node_outputs[node.outputs[0].name] = shape
 
+    def load_compressed_const(output_name):
+        node = compressed_const_ops[output_name]
+        tensor = node.node_def.attr["value"].tensor
+        tensor.tensor_content = const_node_values[node.name]
+        outputs_to_values[output_name] = get_tf_tensor_data(tensor)
+        outputs_to_dtypes[output_name] = node.outputs[0].dtype
+
+    def is_value_known(output_name):
+        return output_name in outputs_to_values or output_name in compressed_const_ops
+
     unneeded_outputs = set()
     progress = True
     while progress:
@@ -222,12 +236,15 @@ def compute_const_folding_using_tf(g, const_node_values, graph_outputs):
                     progress = True
             can_fold = node.type not in ['Enter', 'Placeholder', 'PlaceholderWithDefault']
             can_fold = can_fold and not node.type.startswith('Random')
-            can_fold = can_fold and len(input_names) > 0 and all(inp in outputs_to_values for inp in input_names)
+            can_fold = can_fold and len(input_names) > 0 and all(is_value_known(inp) for inp in input_names)
             # We can only fold nodes with a single output
             can_fold = can_fold and len(output_names) == 1 and output_names[0] not in outputs_to_values
             # Skip if value already computed, used, and discarded
             can_fold = can_fold and output_names[0] not in unneeded_outputs and output_names[0] not in graph_outputs
             if can_fold:
+                for inp in input_names:
+                    if inp not in outputs_to_values:
+                        load_compressed_const(inp)
                 # Make a mini graph containing just the node to fold
                 g2 = tf.Graph()
                 with g2.as_default():
@@ -15,6 +15,7 @@ import traceback
 
 import numpy as np
 from onnx import onnx_pb
+import tensorflow as tf
 
 import tf2onnx
 import tf2onnx.onnx_opset  # pylint: disable=unused-import
@@ -25,7 +26,7 @@ from tf2onnx.rewriter import *  # pylint: disable=wildcard-import
 from tf2onnx.tflite_rewriters import *  # pylint: disable=wildcard-import
 from tf2onnx.shape_inference import infer_shape
 from tf2onnx.tf_loader import is_function, resolve_functions, set_function
-from tf2onnx.tf_utils import tensorflow_to_onnx, get_tf_version, compute_const_folding_using_tf
+from tf2onnx.tf_utils import tensorflow_to_onnx, compute_const_folding_using_tf
 from tf2onnx.tflite_utils import read_tflite_model, parse_tflite_graph
 
 from . import constants, logging, schemas, utils, handler
@@ -246,8 +247,9 @@ def tensorflow_onnx_mapping(g, ops_mapping, initialized_tables=None, is_tflite=F
     mapped_op = collections.Counter()
     unmapped_op = collections.Counter()
     exceptions = []
-    if initialized_tables is None:
-        initialized_tables = {}
+    # handlers replace table entries with normalized records, keep them in a private copy
+    # so the caller's mapping is left untouched
+    initialized_tables = dict(initialized_tables or {})
 
     ops = list(g.get_nodes())
     for node in ops:
@@ -414,7 +416,7 @@ def process_tf_graph(tf_graph, continue_on_error=False, verbose=False, target=No
     opset = utils.find_opset(opset)
     if not is_subgraph:
         logger.info("Using tensorflow=%s, onnx=%s, tf2onnx=%s/%s",
-                    get_tf_version(), utils.get_onnx_version(), tf2onnx.__version__, tf2onnx.version.git_version[:6])
+                    tf.__version__, utils.get_onnx_version(), tf2onnx.__version__, tf2onnx.version.git_version[:6])
         logger.info("Using opset <onnx, %s>", opset)
         if opset > schemas.get_max_supported_opset_version():
             logger.warning("Currently installed onnx package %s is too low to support opset %s, "
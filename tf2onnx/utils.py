@@ -367,10 +367,33 @@ def create_vague_shape_like(shape):
     return [-1 for i in enumerate(shape)]
 
 
+def is_small_shape(shape):
+    """Return True if a tensor of the given shape has at most 1000 elements."""
+    return np.product(shape) <= 1000
+
+
+def is_huge_shape(shape):
+    """Return True if a tensor of the given shape has at least 1000000 elements."""
+    return np.product(shape) >= 1000000
+
+
 def get_onnx_version():
     return __version__
 
 
+def make_version_tuple(version):
+    """Turn a version string like "2.4.0rc1" into a tuple of ints like (2, 4, 0) that can be compared."""
+    numbers = []
+    for part in version.split("."):
+        match = re.match(r"\d+", part)
+        if match is None:
+            break
+        numbers.append(int(match.group()))
+        if match.end() != len(part):
+            break
+    return tuple(numbers)
+
+
 def make_opsetid(domain, version):
     make_sure(isinstance(version, int), "version must be an integer")
     return helper.make_opsetid(domain, version)